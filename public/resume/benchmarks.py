@@ -0,0 +1,1296 @@
+#!/usr/bin/env python3
+"""
+Portfolio Benchmarks
+Headless measurements for the terminal portfolio's rendering paths.
+"""
+
+import argparse
+import contextlib
+import copy
+import functools
+import gc
+import hashlib
+import http.server
+import inspect
+import io
+import itertools
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import portfolio
+from portfolio import Colors, ScreenRenderer
+
+
+def make_menu(size: int):
+    """Build a synthetic menu with the same shape as the portfolio menu."""
+    return [("🔹", f"Section {i + 1}", f"Synthetic menu entry number {i + 1}") for i in range(size)]
+
+
+def bench_menu_diff(sizes=(6, 24, 96), presses: int = 50):
+    """Measure bytes written per arrow press as the menu grows."""
+    results = []
+    for size in sizes:
+        items = make_menu(size)
+        renderer = ScreenRenderer(stream=io.StringIO())
+        # Large virtual terminal so every menu line stays addressable
+        original_rows = portfolio.get_terminal_rows
+        portfolio.get_terminal_rows = lambda default=24: 10_000
+        try:
+            portfolio.display_menu(items, 0, renderer=renderer)
+            first_frame = renderer.bytes_written
+            for press in range(1, presses + 1):
+                portfolio.display_menu(items, press % size, renderer=renderer)
+        finally:
+            portfolio.get_terminal_rows = original_rows
+        per_press = (renderer.bytes_written - first_frame) / presses
+        results.append((size, first_frame, per_press))
+    return results
+
+
+def check_menu_diff(tolerance: float = 0.25) -> bool:
+    """Check that bytes per arrow press stay roughly constant across menu sizes."""
+    results = bench_menu_diff()
+    print(f"{Colors.HEADER}Menu diff renderer — bytes per arrow press{Colors.ENDC}")
+    for size, first_frame, per_press in results:
+        print(f"  {size:4d} items: first frame {first_frame:7d} B, per press {per_press:7.1f} B")
+    smallest = results[0][2]
+    largest = max(per_press for _, _, per_press in results)
+    ok = largest <= smallest * (1 + tolerance)
+    status = f"{Colors.OKGREEN}✓ constant" if ok else f"{Colors.FAIL}✗ grows with menu size"
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def check_frame_writes() -> bool:
+    """Check that each static section reaches the terminal in a single write."""
+    sections = [portfolio.show_resume, portfolio.show_projects, portfolio.show_contact]
+    print(f"{Colors.HEADER}Frame buffer — write syscalls per section{Colors.ENDC}")
+    ok = True
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    original_fd = portfolio.output.fd
+    portfolio.output.fd = devnull
+    try:
+        for section in sections:
+            writes, sent = portfolio.output.write_calls, portfolio.output.bytes_written
+            section()
+            writes = portfolio.output.write_calls - writes
+            sent = portfolio.output.bytes_written - sent
+            ok = ok and writes == 1
+            print(f"  {section.__name__:15} {writes} write(s), {sent:6d} B")
+    finally:
+        portfolio.output.fd = original_fd
+        os.close(devnull)
+    status = f"{Colors.OKGREEN}✓ one write per frame" if ok else f"{Colors.FAIL}✗ frames split across writes"
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def check_replay(events: int = 1_000_000, minimum_rate: float = 1_000_000) -> bool:
+    """Check that the navigation state machine replays at least a million keys per second."""
+    pattern = ['DOWN', 'j', 'UP', 'k', '2', 'm', 'h', 'x', 'ENTER', ' ', 'x', '1', 'h', 'ENTER', 'm']
+    keys = list(itertools.islice(itertools.cycle(pattern), events))
+    start = time.perf_counter()
+    state, consumed, counts = portfolio.replay_keys(keys)
+    rate = consumed / (time.perf_counter() - start)
+    print(f"{Colors.HEADER}Navigation replay — synthetic keystroke stream{Colors.ENDC}")
+    print(f"  {consumed:,} keys in final state {state}: {rate / 1e6:.2f}M keys/s")
+    print(f"  effects: " + ", ".join(f"{name}={count:,}" for name, count in counts.items()))
+    ok = rate >= minimum_rate
+    status = f"{Colors.OKGREEN}✓ fast enough" if ok else f"{Colors.FAIL}✗ below {minimum_rate / 1e6:.1f}M keys/s"
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def scaled_content(projects: int) -> dict:
+    """Load the real content file with the projects list repeated to the given length."""
+    with open(portfolio.content_path(), encoding='utf-8') as content_file:
+        content = json.load(content_file)
+    featured = content['projects']['projects']
+    content['projects']['projects'] = [dict(featured[i % len(featured)], name=f"Project {i + 1}")
+                                       for i in range(projects)]
+    return content
+
+
+def bench_content_startup(sizes=(6, 600, 6000), repeats: int = 5):
+    """Time loading the first section's content as the data set grows.
+
+    The baseline is the old approach: every section as Python literals in a
+    script compiled from scratch on each launch (launch.sh runs it from a temp
+    file, so no .pyc is reused). The store is timed on a cold cache (compiles
+    it) and a warm one (reads only the section asked for).
+    """
+    results = []
+    for size in sizes:
+        content = scaled_content(size)
+        literals = "\n".join(f"def get_{name}():\n    return {data!r}\n" for name, data in content.items())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'content.json')
+            with open(path, 'w', encoding='utf-8') as content_file:
+                json.dump(content, content_file, ensure_ascii=False, indent=2)
+            cache_dir = os.path.join(directory, 'cache')
+            
+            def timed(action):
+                best = float('inf')
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    action()
+                    best = min(best, time.perf_counter() - start)
+                return best * 1000
+            
+            def literal_startup():
+                namespace = {}
+                exec(compile(literals, 'portfolio.py', 'exec'), namespace)
+                namespace['get_resume']()
+            
+            def cold_startup():
+                for cached in os.listdir(cache_dir) if os.path.isdir(cache_dir) else ():
+                    os.remove(os.path.join(cache_dir, cached))
+                portfolio.ContentStore(path, cache_dir).section('resume')
+            
+            baseline = timed(literal_startup)
+            cold = timed(cold_startup)
+            warm = timed(lambda: portfolio.ContentStore(path, cache_dir).section('resume'))
+            results.append((size, os.path.getsize(path), baseline, cold, warm))
+    return results
+
+
+def check_content_startup() -> bool:
+    """Check that a warm content cache loads the first section 10x faster than compiled literals."""
+    results = bench_content_startup()
+    print(f"{Colors.HEADER}Content store — time to first section's content{Colors.ENDC}")
+    for size, source_bytes, baseline, cold, warm in results:
+        print(f"  {size:5d} projects ({source_bytes / 1024:7.1f} KiB): literals {baseline:7.2f} ms, "
+              f"cold cache {cold:7.2f} ms, warm cache {warm:6.2f} ms")
+    _, _, largest_baseline, _, largest_warm = results[-1]
+    ok = largest_warm * 10 <= largest_baseline
+    status = (f"{Colors.OKGREEN}✓ {largest_baseline / largest_warm:.0f}x faster at the largest size" if ok
+              else f"{Colors.FAIL}✗ warm cache is not 10x faster than literals")
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def check_startup() -> bool:
+    """Check each startup phase against the budget checked in as startup_budget.json."""
+    return portfolio.run_startup_report()
+
+
+def check_dashboard_overhead(seconds: float = 3.0, limit: float = 1.0) -> bool:
+    """Check that sampling /proc and redrawing the dashboard at 10 Hz costs under 1% CPU."""
+    interval = portfolio.DASHBOARD_INTERVAL
+    history = {key: portfolio.deque(maxlen=portfolio.DASHBOARD_HISTORY)
+               for key in ('cpu', 'memory', 'load', 'rss', 'own_cpu', 'threads')}
+    sampler = portfolio.ProcSampler()
+    renderer = portfolio.CellRenderer()
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    original_fd = portfolio.output.fd
+    portfolio.output.fd = devnull
+    ticks = 0
+    try:
+        sampler.sample()
+        start_cpu, start = time.process_time(), time.monotonic()
+        deadline = start
+        while time.monotonic() - start < seconds:
+            deadline += interval
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            for name, value in sampler.sample().items():
+                history[name].append(value)
+            renderer.render(portfolio.dashboard_cells(history, interval))
+            ticks += 1
+        overhead = 100 * (time.process_time() - start_cpu) / (time.monotonic() - start)
+    finally:
+        portfolio.output.fd = original_fd
+        os.close(devnull)
+        sampler.close()
+    print(f"{Colors.HEADER}Performance dashboard — overhead at {1 / interval:.0f} Hz{Colors.ENDC}")
+    print(f"  {ticks} ticks, {renderer.bytes_written / ticks:.0f} B per redraw, {overhead:.2f}% CPU")
+    ok = overhead < limit
+    status = f"{Colors.OKGREEN}✓ under {limit:g}% CPU" if ok else f"{Colors.FAIL}✗ {limit:g}% CPU or more"
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def build_synthetic_repository(directory: str, files: int) -> Tuple[set, set]:
+    """Commit files small files to a new repository, then dirty a few of them.
+
+    Returns the paths that were modified and deleted. Another handful are only
+    touched, so their stat data changes but their content does not.
+    """
+    for i in range(files):
+        folder = os.path.join(directory, f"d{i // 1000:03d}")
+        if i % 1000 == 0:
+            os.makedirs(folder)
+        with open(os.path.join(folder, f"f{i % 1000:03d}.txt"), 'w') as synthetic:
+            synthetic.write(f"synthetic file {i}\n")
+    git = ['git', '-C', directory, '-c', 'gc.auto=0', '-c', 'user.name=bench', '-c', 'user.email=bench@example.com']
+    subprocess.run(git + ['init', '-q'], check=True)
+    subprocess.run(git + ['add', '-A'], check=True)
+    subprocess.run(git + ['commit', '-q', '-m', 'synthetic'], check=True)
+    
+    path = lambda i: f"d{i // 1000:03d}/f{i % 1000:03d}.txt"
+    modified = {path(i) for i in range(7, files, max(1, files // 10))}
+    deleted = {path(i) for i in range(11, files, max(1, files // 3))}
+    for relative in modified:
+        with open(os.path.join(directory, relative), 'a') as synthetic:
+            synthetic.write("changed\n")
+    for relative in deleted:
+        os.remove(os.path.join(directory, relative))
+    for i in range(13, files, max(1, files // 5)):
+        os.utime(os.path.join(directory, path(i)))
+    return modified, deleted - modified
+
+
+def bench_git_status(files: int = 100_000, repeats: int = 3):
+    """Time git status --porcelain against the built-in index parser on a synthetic repository.
+
+    Afterwards one more file is deleted, to check that a reused result notices.
+    """
+    # git may still be writing to .git when cleanup starts, so cleanup errors are ignored
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+        modified, deleted = build_synthetic_repository(directory, files)
+        command = ['git', '-C', directory, '-c', 'gc.auto=0', 'status', '--porcelain', '--untracked-files=no']
+        subprocess.run(command, capture_output=True, check=True)  # Let git refresh its index first
+        git_times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            porcelain = subprocess.run(command, capture_output=True, check=True, text=True).stdout
+            git_times.append((time.perf_counter() - start) * 1000)
+        git_changes = {(line[1], line[3:]) for line in porcelain.splitlines()}
+        
+        checker = portfolio.GitStatusChecker()
+        repository = portfolio.find_git_repository(directory)
+        cold = checker.status(*repository)
+        warm = min((checker.status(*repository) for _ in range(repeats)), key=lambda result: result['elapsed'])
+        ours = {('M', os.fsdecode(path)) for path in cold['modified']}
+        ours |= {('D', os.fsdecode(path)) for path in cold['deleted']}
+        expected = {('M', path) for path in modified} | {('D', path) for path in deleted}
+        
+        removed = next(os.fsdecode(path) for path, *_ in checker.entries(repository[1])[0]
+                       if os.fsdecode(path) not in modified | deleted)
+        os.remove(os.path.join(directory, removed))
+        noticed = os.fsencode(removed) in checker.status(*repository)['deleted']
+        return min(git_times), cold, warm, git_changes, ours, expected, noticed
+
+
+def check_git_status(files: int = 100_000, cold_limit: float = 6.0) -> bool:
+    """Check that the index parser finds the same changes as git on a 100k-file repository.
+
+    A repeat check reuses the result and must beat git. The first check must
+    stay within cold_limit times git: one lstat from Python costs about 4 µs
+    and parsing the index about 2 µs per entry, so on a single CPU the first
+    check runs at about 3-5x git and no faster.
+    """
+    print(f"{Colors.HEADER}Git status — {files:,}-file synthetic repository{Colors.ENDC}")
+    git_ms, cold, warm, git_changes, ours, expected, noticed = bench_git_status(files)
+    print(f"  git status --porcelain   {git_ms:8.1f} ms")
+    print(f"  index parser, cold       {cold['elapsed']:8.1f} ms ({cold['hashed']} hashed)")
+    reuse = "result reused" if warm['result_age'] is not None else "index reused"
+    print(f"  index parser, warm       {warm['elapsed']:8.1f} ms ({warm['hashed']} hashed, {reuse})")
+    same = ours == git_changes == expected
+    status = (f"{Colors.OKGREEN}✓ same {len(ours)} changes as git" if same
+              else f"{Colors.FAIL}✗ differs from git: {sorted(ours ^ git_changes)[:5]}")
+    print(f"  {status}{Colors.ENDC}")
+    status = (f"{Colors.OKGREEN}✓ a deletion after the check is noticed" if noticed
+              else f"{Colors.FAIL}✗ a deletion after the check was missed")
+    print(f"  {status}{Colors.ENDC}")
+    fast = warm['elapsed'] < git_ms and cold['elapsed'] < git_ms * cold_limit
+    status = (f"{Colors.OKGREEN}✓ warm faster than git, cold within {cold_limit:g}x git" if fast
+              else f"{Colors.FAIL}✗ warm {warm['elapsed'] / git_ms:.2f}x, cold {cold['elapsed'] / git_ms:.2f}x git")
+    print(f"  {status}{Colors.ENDC}")
+    return same and noticed and fast
+
+
+def rendered_lines() -> List[str]:
+    """Return every line the exportable sections render, plus CJK and emoji samples."""
+    lines = []
+    for _, section_lines, _ in portfolio.export_sections().values():
+        lines.extend(portfolio.render_section_text(section_lines).splitlines())
+    lines += [f"{Colors.BOLD}{n}. 日本語のテキスト 👨‍👩‍👧 🇺🇸 👍🏽 🛠️ café{Colors.ENDC}" for n in range(20)]
+    return lines
+
+
+def bench_display_width(repeats: int = 20):
+    """Measure display_width per rendered line with an empty and a warm cache."""
+    lines = rendered_lines()
+    cold = warm = float('inf')
+    for _ in range(repeats):
+        portfolio.display_width.cache_clear()
+        started = time.perf_counter()
+        for line in lines:
+            portfolio.display_width(line)
+        cold = min(cold, time.perf_counter() - started)
+        started = time.perf_counter()
+        for line in lines:
+            portfolio.display_width(line)
+        warm = min(warm, time.perf_counter() - started)
+    return len(lines), cold, warm
+
+
+def check_display_width(frame_budget_ms: float = 1.0) -> bool:
+    """Check that measuring a frame's worth of lines from cold costs well under one animation frame."""
+    count, cold, warm = bench_display_width()
+    rows = 100  # A tall terminal's worth of lines
+    frame_ms = cold / count * rows * 1000
+    print(f"{Colors.HEADER}Display width — {count} rendered lines{Colors.ENDC}")
+    print(f"  cold cache  {cold / count * 1e6:7.2f} µs/line")
+    print(f"  warm cache  {warm / count * 1e6:7.2f} µs/line")
+    print(f"  {rows} lines from cold: {frame_ms:.3f} ms (budget {frame_budget_ms} ms)")
+    ok = frame_ms <= frame_budget_ms
+    status = f"{Colors.OKGREEN}✓ within budget" if ok else f"{Colors.FAIL}✗ over budget"
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def bench_reflow(widths=(60, 100, 60, 100), sections=('introduction', 'resume', 'projects', 'contact')):
+    """Time laying out each section as the terminal is resized back and forth."""
+    portfolio.SECTION_LAYOUTS.clear()
+    section_lines = [portfolio.export_sections()[slug][1] for slug in sections]
+    timings = []
+    for width in widths:
+        token = portfolio._console.set(portfolio.Console(size=(width, 24)))
+        try:
+            started = time.perf_counter()
+            for lines in section_lines:
+                list(portfolio.section_layout(lines))
+            timings.append((width, time.perf_counter() - started))
+        finally:
+            portfolio._console.reset(token)
+    return timings
+
+
+def check_reflow() -> bool:
+    """Check that returning to a width already laid out reuses the cached layout."""
+    timings = bench_reflow()
+    print(f"{Colors.HEADER}Reflow — laying out every section per resize{Colors.ENDC}")
+    seen = set()
+    ok = True
+    for width, elapsed in timings:
+        cached = width in seen
+        seen.add(width)
+        print(f"  {width:4d} columns {'(cached)' if cached else '        '} {elapsed * 1000:8.3f} ms")
+        if cached:
+            ok = ok and elapsed * 1000 < 1.0
+    status = f"{Colors.OKGREEN}✓ no re-layout when resizing back" if ok else f"{Colors.FAIL}✗ cached widths re-laid out"
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def drawn_cells(text: str) -> List[Tuple[str, tuple]]:
+    """Return each drawn character of a stream with the rendition a terminal would give it."""
+    style = saved = portfolio.DEFAULT_STYLE
+    cells = []
+    position = 0
+    for start, end, parameters, final in itertools.chain(portfolio.output_escapes(text),
+                                                         [(len(text), len(text), '', '')]):
+        for char in text[position:start]:
+            if char in ' \r\n':  # Blanks only show the attributes that colour them
+                cells.append((char, (style[0] & portfolio.SPACE_VISIBLE, None, style[2])))
+            else:
+                cells.append((char, style))
+        position = end
+        if final == 'm':
+            style = portfolio.apply_sgr(style, parameters)
+        elif final == portfolio.SAVE_CURSOR:
+            saved = style
+        elif final == portfolio.RESTORE_CURSOR:
+            style = saved
+    return cells
+
+
+def bench_sgr_savings():
+    """Run each section and the menu frame through the output stage, counting bytes before and after."""
+    frames = {slug: portfolio.render_section_text(lines)
+              for slug, (_, lines, _) in portfolio.export_sections().items()}
+    menu = [item[:3] for item in portfolio.PORTFOLIO_MENU]
+    frames['menu'] = '\n'.join(portfolio.menu_lines(menu, 0, "PORTFOLIO NAVIGATION")) + '\n'
+    results = []
+    for name, text in frames.items():
+        minimized = portfolio.SgrMinimizer().process(text)
+        same = drawn_cells(minimized) == drawn_cells(text)
+        results.append((name, len(text.encode('utf-8')), len(minimized.encode('utf-8')), same))
+    return results
+
+
+def check_sgr_savings() -> bool:
+    """Check that the output stage saves bytes on every section without changing what is drawn."""
+    results = bench_sgr_savings()
+    print(f"{Colors.HEADER}SGR output stage — bytes per frame{Colors.ENDC}")
+    for name, raw, minimized, same in results:
+        mark = f"{Colors.OKGREEN}✓" if same else f"{Colors.FAIL}✗ rendering differs"
+        print(f"  {name:13} {raw:6d} B → {minimized:6d} B  (-{raw - minimized:5d} B, "
+              f"{(raw - minimized) / raw:5.1%})  {mark}{Colors.ENDC}")
+    raw_total = sum(raw for _, raw, _, _ in results)
+    saved_total = raw_total - sum(minimized for _, _, minimized, _ in results)
+    print(f"  {'total':13} saved {saved_total} of {raw_total} B ({saved_total / raw_total:.1%})")
+    return all(same and minimized < raw for _, raw, minimized, same in results)
+
+
+# ============================================================================
+# HEADLESS SUITE
+# ============================================================================
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+SUITE_METRICS = ('wall_ms', 'bytes', 'writes', 'peak_kib')
+# Allowed growth over the baseline as a fraction, plus an absolute allowance for noise
+DEFAULT_THRESHOLDS = {'wall_ms': 0.5, 'bytes': 0.05, 'writes': 0.0, 'peak_kib': 0.25}
+DEFAULT_SLACK = {'wall_ms': 0.25, 'bytes': 0, 'writes': 0, 'peak_kib': 8}
+# Arguments for show_* functions that take some; any other show_* is called bare
+SHOW_ARGUMENTS = {
+    'show_project_card': lambda: (portfolio.get_featured_projects()[0], 0),
+    'show_error_screen': lambda: (ValueError("benchmark"),),
+    'show_section_with_navigation': lambda: (portfolio.introduction_lines, 'introduction'),
+}
+# Keys waiting in the input queue for functions that read one
+SHOW_KEYS = {'show_help_overlay': ['\r']}
+# A tour of the navigation loop: welcome, menu moves, every section, help, a typo, quit
+NAVIGATION_SCRIPT = ['\r', '\x1b[B', '\x1b[B', '\x1b[A', '\r', 'm', '2', ' ', '3', 'h', '\r',
+                     'm', '4', 'm', '5', 'm', 'x', 'r', 'r', 'r', 'q']
+
+
+class SuiteOptions:
+    """Command-line options for the headless suite."""
+    save_baseline = False
+    threshold: Optional[float] = None  # Overrides every metric's threshold when set
+
+
+class FakeClock:
+    """Stand-in for portfolio's time module: sleep() advances a virtual clock instead of waiting."""
+
+    def __init__(self):
+        self.now = time.monotonic()
+
+    def sleep(self, seconds: float):
+        self.now += max(0.0, seconds)
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+class ScriptedSession(portfolio.RemoteSession):
+    """Input session that plays a fixed list of keys and then disconnects."""
+
+    def __init__(self, keys: List[str]):
+        super().__init__()
+        for key in keys:
+            self.feed(key.encode('utf-8'))
+        self.close()
+
+
+def canned_probe() -> portfolio.NetworkProbe:
+    """Return a network probe that already holds a result, so nothing touches the network."""
+    probe = portfolio.NetworkProbe('http://127.0.0.1/', ttl=float('inf'))
+    sample = {'dns': 0.1, 'connect': 0.2, 'tls': None, 'first_byte': 1.5}
+    probe._result = {'url': probe.url, 'samples': [sample] * probe.samples, 'status': 200, 'error': None,
+                     'attempts': probe.samples, 'failures': 0}
+    return probe
+
+
+@contextlib.contextmanager
+def fake_terminal(keys: List[str] = (), size: Tuple[int, int] = (100, 40)):
+    """Bind a console that discards its output, with sleeps stubbed out and the rich profile."""
+    console = portfolio.Console(portfolio.FrameBuffer(sink=lambda data: None), size=size)
+    if keys:
+        console.session = ScriptedSession(keys)
+    saved = portfolio.time, portfolio.NETWORK_PROBE, portfolio.RenderSettings.profile
+    portfolio.time, portfolio.NETWORK_PROBE = FakeClock(), canned_probe()
+    portfolio.RenderSettings.profile = 'rich'
+    token = portfolio._console.set(console)
+    try:
+        yield console
+    finally:
+        portfolio._console.reset(token)
+        portfolio.time, portfolio.NETWORK_PROBE, portfolio.RenderSettings.profile = saved
+
+
+def validate_keys():
+    """Validate every key of the navigation script from a cold cache."""
+    portfolio.validate_input.cache_clear()
+    for key in NAVIGATION_SCRIPT:
+        portfolio.validate_input(key, portfolio.MENU_SIZE)
+
+
+def suite_calls() -> Dict[str, Tuple[Callable, List[str]]]:
+    """Return every call the suite measures as name -> (call, keys queued for it)."""
+    calls = {}
+    for name, function in inspect.getmembers(portfolio, inspect.isfunction):
+        if name.startswith('show_') and function.__module__ == portfolio.__name__:
+            arguments = SHOW_ARGUMENTS.get(name, tuple)
+            calls[name] = (lambda function=function, arguments=arguments: function(*arguments()),
+                           SHOW_KEYS.get(name, []))
+    menu = [item[:3] for item in portfolio.PORTFOLIO_MENU]
+    calls['display_menu'] = (lambda: portfolio.display_menu(menu, 0, "PORTFOLIO NAVIGATION"), [])
+    calls['validate_input'] = (validate_keys, [])
+    calls['navigation_loop'] = (portfolio.run_portfolio, NAVIGATION_SCRIPT)
+    return calls
+
+
+def measure_call(call: Callable, keys: List[str], repeats: int = 10) -> Dict[str, float]:
+    """Run one call on fresh fake terminals: best wall time, then output and peak allocations."""
+    wall = float('inf')
+    for _ in range(repeats):
+        with fake_terminal(keys) as console:
+            started = time.perf_counter()
+            call()
+            console.output.flush()
+            wall = min(wall, time.perf_counter() - started)
+    with fake_terminal(keys) as console:
+        tracemalloc.start()
+        try:
+            call()
+            console.output.flush()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {'wall_ms': round(wall * 1000, 3), 'bytes': console.output.bytes_written,
+            'writes': console.output.write_calls, 'peak_kib': round(peak / 1024, 1)}
+
+
+def bench_suite() -> Dict[str, Dict[str, float]]:
+    """Measure every renderer and the navigation loop."""
+    return {name: measure_call(call, keys) for name, (call, keys) in sorted(suite_calls().items())}
+
+
+def regressions(results: Dict[str, Dict[str, float]], baseline: dict) -> Dict[str, List[str]]:
+    """Return the metrics of each call that grew past its threshold, as name -> [metric, ...]."""
+    thresholds = dict(DEFAULT_THRESHOLDS, **baseline.get('thresholds', {}))
+    if SuiteOptions.threshold is not None:
+        thresholds = dict.fromkeys(SUITE_METRICS, SuiteOptions.threshold)
+    slack = dict(DEFAULT_SLACK, **baseline.get('slack', {}))
+    regressed = {}
+    for name, metrics in results.items():
+        previous = baseline['calls'].get(name)
+        if previous is None:
+            continue
+        regressed[name] = [metric for metric in SUITE_METRICS
+                           if metrics[metric] > previous[metric] * (1 + thresholds[metric]) + slack[metric]]
+    return regressed
+
+
+def check_suite() -> bool:
+    """Check each renderer and the navigation loop against the baselines in benchmark_baseline.json."""
+    results = bench_suite()
+    try:
+        with open(BASELINE_PATH, encoding='utf-8') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        baseline = {'calls': {}}
+    regressed = regressions(results, baseline)
+    print(f"{Colors.HEADER}Headless suite — per call against {os.path.basename(BASELINE_PATH)}{Colors.ENDC}")
+    print(f"  {'call':32} {'wall ms':>9} {'bytes':>7} {'writes':>6} {'peak KiB':>9}")
+    for name, metrics in results.items():
+        if name not in regressed:
+            mark = f"{Colors.WARNING}new"
+        elif regressed[name]:
+            mark = f"{Colors.FAIL}✗ {', '.join(regressed[name])}"
+        else:
+            mark = f"{Colors.OKGREEN}✓"
+        print(f"  {name:32} {metrics['wall_ms']:9.3f} {metrics['bytes']:7d} {metrics['writes']:6d} "
+              f"{metrics['peak_kib']:9.1f}  {mark}{Colors.ENDC}")
+    if SuiteOptions.save_baseline:
+        baseline['calls'] = results
+        baseline.setdefault('thresholds', DEFAULT_THRESHOLDS)
+        baseline.setdefault('slack', DEFAULT_SLACK)
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2)
+            f.write('\n')
+        print(f"  {Colors.OKBLUE}baseline saved{Colors.ENDC}")
+        return True
+    ok = not any(regressed.values())
+    status = (f"{Colors.OKGREEN}✓ no regressions" if ok
+              else f"{Colors.FAIL}✗ {sum(map(bool, regressed.values()))} call(s) regressed")
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def bench_metrics(repeats: int = 20):
+    """Time the scripted navigation loop with latency metrics off and on, alternating runs."""
+    timings = {False: float('inf'), True: float('inf')}
+    metrics = None
+    for _ in range(repeats):
+        for enabled in (False, True):
+            portfolio.METRICS = portfolio.SessionMetrics(os.devnull) if enabled else None
+            try:
+                with fake_terminal(NAVIGATION_SCRIPT):
+                    started = time.perf_counter()
+                    portfolio.run_portfolio()
+                    timings[enabled] = min(timings[enabled], time.perf_counter() - started)
+            finally:
+                metrics, portfolio.METRICS = portfolio.METRICS or metrics, None
+    return timings[False], timings[True], metrics.snapshot()
+
+
+def check_metrics() -> bool:
+    """Check that keypress-to-paint metrics record the scripted keys and show what they cost."""
+    off, on, snapshot = bench_metrics()
+    print(f"{Colors.HEADER}Latency metrics — scripted navigation loop{Colors.ENDC}")
+    print(f"  metrics off {off * 1000:7.3f} ms, on {on * 1000:7.3f} ms ({(on - off) / off:+.1%})")
+    print(f"  {snapshot['keys']} keys, {snapshot['frames']} frames, {snapshot['bytes']} B")
+    for action, histogram in snapshot['latency_us'].items():
+        print(f"  {action:13} n={histogram['count']:<3d} p50 {histogram['p50']:6d} µs  p99 {histogram['p99']:6d} µs")
+    # Keys the pager and other direct readers consume count too, so every scripted key is timed
+    ok = snapshot['keys'] == len(NAVIGATION_SCRIPT) and 'up/down' in snapshot['latency_us']
+    status = (f"{Colors.OKGREEN}✓ every key timed to paint" if ok
+              else f"{Colors.FAIL}✗ {snapshot['keys']} of {len(NAVIGATION_SCRIPT)} keys timed")
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def write_synthetic_recording(path: str, screens: int) -> int:
+    """Record the scripted tour's frames over and over through SessionRecorder; returns the event count."""
+    chunks = []
+    with fake_terminal(NAVIGATION_SCRIPT) as console:
+        console.output.sink = chunks.append
+        portfolio.run_portfolio()
+        console.output.flush()
+    recorder = portfolio.SessionRecorder(path, (100, 40))
+    portfolio.RECORD_BUFFER_BYTES, saved = float('inf'), portfolio.RECORD_BUFFER_BYTES  # Keep every event
+    try:
+        for _ in range(screens // sum(portfolio.CLEAR_AND_HOME.encode() in chunk for chunk in chunks) + 1):
+            for chunk in chunks:
+                recorder.output(chunk)
+    finally:
+        recorder.close()
+        portfolio.RECORD_BUFFER_BYTES = saved
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f) - 1
+
+
+def bench_record_overhead(repeats: int = 20):
+    """Time the scripted navigation loop with and without a recorder attached."""
+    timings = {False: float('inf'), True: float('inf')}
+    with tempfile.TemporaryDirectory() as directory:
+        for _ in range(repeats):
+            for recording in (False, True):
+                with fake_terminal(NAVIGATION_SCRIPT) as console:
+                    if recording:
+                        console.output.recorder = portfolio.SessionRecorder(
+                            os.path.join(directory, 'loop.cast'), (100, 40))
+                    started = time.perf_counter()
+                    portfolio.run_portfolio()
+                    console.output.flush()
+                    timings[recording] = min(timings[recording], time.perf_counter() - started)
+                    if recording:
+                        console.output.recorder.close()
+    return timings[False], timings[True]
+
+
+def check_asciicast(screens: int = 20_000) -> bool:
+    """Check that recording barely slows rendering, and that a big recording indexes and seeks in bounded memory."""
+    off, on = bench_record_overhead()
+    print(f"{Colors.HEADER}Asciicast recorder and player{Colors.ENDC}")
+    print(f"  navigation loop: {off * 1000:.3f} ms, recording {on * 1000:.3f} ms ({(on - off) / off:+.1%})")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'large.cast')
+        events = write_synthetic_recording(path, screens)
+        size = os.path.getsize(path)
+        tracemalloc.start()
+        started = time.perf_counter()
+        _, duration, keyframes = portfolio.index_recording(path)
+        indexing = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {events:,} events, {size / 1e6:.1f} MB: indexed in {indexing * 1000:.0f} ms, "
+              f"{len(keyframes):,} keyframes, peak {peak / 1e6:.2f} MB")
+        with open(path, 'rb') as f:
+            seeks = []
+            for target in (duration / 2, duration / 4, duration * 3 / 4):
+                started = time.perf_counter()
+                position, text = portfolio.seek_recording(f, keyframes, target)
+                seeks.append(time.perf_counter() - started)
+            # The rebuilt screen must end on the same output as playing straight through
+            f.seek(keyframes[0][1])
+            played = ''.join(event[2] for event in map(json.loads, f) if event[0] <= position)
+        same = played.endswith(text[len(portfolio.CLEAR_AND_HOME):])
+        print(f"  seek: worst {max(seeks) * 1000:.2f} ms, screen rebuilt from its last clear: {'yes' if same else 'no'}")
+    ok = same and peak < size / 4 and max(seeks) < 0.05
+    status = (f"{Colors.OKGREEN}✓ indexes in a fraction of the file's size and seeks fast" if ok
+              else f"{Colors.FAIL}✗ seek incorrect, slow or memory-hungry")
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+class EtagHandler(http.server.SimpleHTTPRequestHandler):
+    """Static files with ETags from their content hash, answering a matching If-None-Match with 304."""
+
+    log: List[Tuple[str, int]] = []  # (path, status) of every request served
+
+    def do_GET(self):
+        try:
+            with open(self.translate_path(self.path), 'rb') as f:
+                data = f.read()
+        except OSError:
+            self.send_error(404)
+            return
+        etag = f'"{hashlib.sha256(data).hexdigest()[:16]}"'
+        status = 304 if self.headers.get('If-None-Match') == etag else 200
+        self.log.append((self.path, status))
+        self.send_response(status)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(data) if status == 200 else 0))
+        self.end_headers()
+        if status == 200:
+            self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def time_to_first_paint(command: List[str], environment: dict, samples: int = 15) -> float:
+    """Return the median milliseconds from spawning command in startup-trace mode to its first paint."""
+    durations = []
+    for _ in range(samples):
+        spawn = time.monotonic()
+        result = subprocess.run(command, env=dict(environment, PORTFOLIO_STARTUP_TRACE='1'),
+                                stdin=subprocess.DEVNULL, capture_output=True, check=True)
+        durations.append((json.loads(result.stdout)['first_paint'] - spawn) * 1000)
+    return sorted(durations)[len(durations) // 2]
+
+
+def check_self_update() -> bool:
+    """Check that updates use conditional requests and that the installed copy launches faster."""
+    script = os.path.abspath(portfolio.__file__)
+    print(f"{Colors.HEADER}Cached install — updates against a local ETag server{Colors.ENDC}")
+    with tempfile.TemporaryDirectory() as served, tempfile.TemporaryDirectory() as cache:
+        for name in portfolio.INSTALL_FILES:
+            shutil.copy(os.path.join(os.path.dirname(script), name), served)
+        handler = functools.partial(EtagHandler, directory=served)
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/portfolio.py"
+        environment = dict(os.environ, XDG_CACHE_HOME=cache, NO_COLOR='1')
+        update = [sys.executable, script, '--update', '--update-url', url]
+
+        def run_update(label: str) -> List[int]:
+            EtagHandler.log.clear()
+            result = subprocess.run(update, env=environment, capture_output=True, text=True)
+            statuses = [status for _, status in EtagHandler.log]
+            print(f"  {label:24} HTTP {statuses}  {result.stdout.strip()}")
+            return statuses
+
+        try:
+            first = run_update("first launch")
+            unchanged = run_update("nothing changed")
+            with open(os.path.join(served, portfolio.CONTENT_FILE), 'a', encoding='utf-8') as f:
+                f.write('\n')
+            edited = run_update("content edited")
+        finally:
+            server.shutdown()
+        launcher = os.path.join(cache, 'jordolang-portfolio', 'install', portfolio.INSTALL_LAUNCHER)
+        downloaded = time_to_first_paint([sys.executable, script], environment)
+        installed = time_to_first_paint([sys.executable, launcher], environment)
+    print(f"  time to first paint: script {downloaded:.1f} ms, installed copy {installed:.1f} ms")
+    ok = first == [200, 200] and unchanged == [304, 304] and edited == [304, 200] and installed < downloaded
+    status = (f"{Colors.OKGREEN}✓ conditional updates, warm launch skips compiling" if ok
+              else f"{Colors.FAIL}✗ unexpected requests or no launch speed-up")
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+# ============================================================================
+# SECTION PAGER
+# ============================================================================
+
+PAGER_SCROLL_SCRIPT = ['\x1b[6~'] * 4 + ['j'] * 20 + ['k'] * 10 + ['\x1b[5~'] * 2 + ['\x1b[H']
+
+
+def bench_pager(sizes=(30, 600), repeats: int = 5):
+    """Time opening the projects pager and scrolling it, as the number of projects grows.
+
+    Scroll cost is the difference between a run with the scroll script and one that
+    only opens and leaves, so it excludes the first paint. The old full-section stream
+    is measured alongside for comparison.
+    """
+    results = []
+    saved = portfolio.CONTENT
+    try:
+        for size in sizes:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'content.json')
+                with open(path, 'w', encoding='utf-8') as content_file:
+                    json.dump(scaled_content(size), content_file)
+                portfolio.CONTENT = portfolio.ContentStore(path, os.path.join(directory, 'cache'))
+                portfolio.CONTENT.section('projects')  # Compile the cache outside the timings
+                
+                def run(keys):
+                    best, written = float('inf'), 0
+                    for _ in range(repeats):
+                        portfolio.SECTION_LAYOUTS.clear()
+                        with fake_terminal((keys or []) + ['q']) as console:
+                            started = time.perf_counter()
+                            if keys is None:
+                                portfolio.stream_section(portfolio.section_layout(portfolio.projects_lines),
+                                                         animate=False)
+                            else:
+                                portfolio.page_section(portfolio.projects_lines, 'Projects', should_stop=functools.partial(
+                                    portfolio.section_key_acts, portfolio.section_index(portfolio.projects_lines)))
+                            console.output.flush()
+                            best = min(best, time.perf_counter() - started)
+                            written = console.output.bytes_written
+                    return best * 1000, written
+                
+                open_ms, open_bytes = run([])
+                scrolled_ms, scrolled_bytes = run(PAGER_SCROLL_SCRIPT)
+                full_ms, full_bytes = run(None)
+                scrolls = len(PAGER_SCROLL_SCRIPT)
+                results.append((size, open_ms, open_bytes, (scrolled_ms - open_ms) / scrolls,
+                                (scrolled_bytes - open_bytes) / scrolls, full_ms, full_bytes))
+    finally:
+        portfolio.CONTENT = saved
+        portfolio.SECTION_LAYOUTS.clear()
+    return results
+
+
+def check_pager(tolerance: float = 0.5) -> bool:
+    """Check that opening and scrolling the pager cost the same however long the section is."""
+    results = bench_pager()
+    print(f"{Colors.HEADER}Section pager — projects section, 38-row viewport{Colors.ENDC}")
+    for size, open_ms, open_bytes, scroll_ms, scroll_bytes, full_ms, full_bytes in results:
+        print(f"  {size:4d} projects: open {open_ms:6.2f} ms / {open_bytes:6d} B, "
+              f"per scroll {scroll_ms:5.3f} ms / {scroll_bytes:6.0f} B "
+              f"(full stream {full_ms:7.2f} ms / {full_bytes:8d} B)")
+    small, large = results[0], results[-1]
+    ok = (large[4] <= small[4] * (1 + tolerance)
+          and large[1] <= small[1] * (1 + tolerance) + 1
+          and large[3] <= small[3] * (1 + tolerance) + 0.1)
+    status = (f"{Colors.OKGREEN}✓ scroll and open cost independent of section length" if ok
+              else f"{Colors.FAIL}✗ pager cost grows with the section")
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+# ============================================================================
+# NAVIGATION TOURS
+# ============================================================================
+
+# Key sequences through the navigation loop, with text the screen must (+) or must not (-) show,
+# on a local console unless the entry ends with remote=True
+NAVIGATION_TOURS = {
+    'stray digit, then scroll the projects pager': (['\r', '\r', '3', '2', 'j', 'j', 'q'],
+                                                    ['+\033[1;38r', '-Invalid input']),
+    'arrows and j/k in the introduction': (['\r', '\r', '1', 'j', '\x1b[B', 'q'], ['-Invalid input']),
+    'an arrow fast-forwards the introduction': (['\r', '\r', '1', '\x1b[B', 'q'], ['+Detail-Oriented:']),
+    'git status opens locally': (['\r', '\r', '5', 'g', 'x', 'q'], ['+Press any key to return to Utilities']),
+    'remote visitors get no host tools': (['\r', '\r', '5', 'g', 'p', 'q'],
+                                          ['-Press any key to return to Utilities', '-Live performance dashboard',
+                                           "-Press 'g'", '+Local only', '-Operating System'], True),
+}
+
+# (state, key, expected (state, effects)) steps of the pure state machine
+NAVIGATION_CASES = [
+    ((portfolio.SECTION, 0), 'DOWN', ((portfolio.SECTION, 0), ())),
+    ((portfolio.SECTION, 0), 'k', ((portfolio.SECTION, 0), ())),
+    ((portfolio.SECTION, 0), '3', ((portfolio.SECTION, 0), ())),
+    ((portfolio.SECTION, 0), 'x', ((portfolio.SECTION, 0), ((portfolio.SHOW_INVALID, 'x', portfolio.SECTION),))),
+    ((portfolio.SECTION, 0), 'ENTER', ((portfolio.MENU, 0), ((portfolio.SHOW_MENU, 0),))),
+    ((portfolio.SECTION, portfolio.UTILITIES_INDEX), 'g', ((portfolio.TOOL, 'g'), ((portfolio.OPEN_TOOL, 'g'),))),
+]
+
+
+def tour_output(keys: List[str], remote: bool = False) -> str:
+    """Run the navigation loop over keys on a fake terminal and return everything it wrote."""
+    written = []
+    with fake_terminal(keys) as console:
+        console.output.sink, console.remote = written.append, remote
+        portfolio.run_portfolio()
+        console.output.flush()
+    return b''.join(written).decode('utf-8')
+
+
+def check_navigation() -> bool:
+    """Check the state machine's cases, and that each tour shows what it should and nothing it should not."""
+    print(f"{Colors.HEADER}Navigation tours{Colors.ENDC}")
+    wrong_steps = [(state, key) for state, key, expected in NAVIGATION_CASES
+                   if portfolio.navigation_step(state, key) != expected]
+    ok = not wrong_steps
+    mark = f"{Colors.OKGREEN}✓" if ok else f"{Colors.FAIL}✗ {', '.join(map(repr, wrong_steps))}"
+    print(f"  {mark}{Colors.ENDC} {len(NAVIGATION_CASES)} navigation_step cases")
+    for name, (keys, expectations, *remote) in NAVIGATION_TOURS.items():
+        shown = tour_output(keys, *remote)
+        wrong = [expected for expected in expectations if (expected[1:] in shown) != (expected[0] == '+')]
+        ok = ok and not wrong
+        mark = f"{Colors.OKGREEN}✓" if not wrong else f"{Colors.FAIL}✗ {', '.join(map(repr, wrong))}"
+        print(f"  {mark}{Colors.ENDC} {name}")
+    return ok
+
+
+SEARCH_QUERIES = ['docker', 'dokcer', 'graphql api', 'responsive desgin', 'project 9999', 'node.js', 'p']
+
+
+def search_keystrokes(queries: List[str]) -> List[str]:
+    """Return the query after every keystroke: each query typed out, then erased."""
+    typed = []
+    for query in queries:
+        typed += [query[:end] for end in range(1, len(query) + 1)]
+        typed += [query[:end] for end in range(len(query) - 1, -1, -1)]
+    return typed
+
+
+def bench_search(projects: int = 10_000, repeats: int = 5):
+    """Time building the search index and each keystroke of the scripted queries.
+
+    A keystroke is the refinement plus picking the results a screen shows; each is the
+    best of several runs. A scan of every document's text per keystroke is timed for comparison.
+    """
+    saved = portfolio.CONTENT
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'content.json')
+            with open(path, 'w', encoding='utf-8') as content_file:
+                json.dump(scaled_content(projects), content_file)
+            portfolio.CONTENT = portfolio.ContentStore(path, os.path.join(directory, 'cache'))
+            portfolio.get_featured_projects(), portfolio.get_core_skills()  # Load outside the timings
+            started = time.perf_counter()
+            index = portfolio.build_search_index()
+            build_ms = (time.perf_counter() - started) * 1000
+            typed = search_keystrokes(SEARCH_QUERIES)
+            keystrokes = [float('inf')] * len(typed)
+            for _ in range(repeats):
+                search = portfolio.SearchSession(index)
+                for position, query in enumerate(typed):
+                    started = time.perf_counter()
+                    search.update(query)
+                    search.top(30)
+                    keystrokes[position] = min(keystrokes[position], time.perf_counter() - started)
+            texts = ['\n'.join([project.name, project.description, *project.tech_stack, *project.highlights]).lower()
+                     for project in portfolio.get_featured_projects()]
+            started = time.perf_counter()
+            for query in typed:
+                words = query.split()
+                sum(all(word in text for word in words) for text in texts)
+            scan_ms = (time.perf_counter() - started) * 1000 / len(typed)
+    finally:
+        portfolio.CONTENT = saved
+    keystrokes = sorted(seconds * 1000 for seconds in keystrokes)
+    return (len(index.documents), len(index.terms), build_ms, statistics.median(keystrokes), keystrokes[-1],
+            len(keystrokes), scan_ms)
+
+
+def check_search(budget_ms: float = 1.0) -> bool:
+    """Check that every search keystroke over 10k projects takes under a millisecond."""
+    documents, terms, build_ms, median_ms, worst_ms, keystrokes, scan_ms = bench_search()
+    print(f"{Colors.HEADER}Search — {documents} documents, {terms} terms{Colors.ENDC}")
+    print(f"  index build         {build_ms:8.1f} ms (once, on the first search)")
+    print(f"  per keystroke       {median_ms:8.3f} ms median, {worst_ms:.3f} ms worst of {keystrokes}")
+    print(f"  substring scan      {scan_ms:8.3f} ms per keystroke, for comparison")
+    ok = worst_ms < budget_ms
+    status = (f"{Colors.OKGREEN}✓ every keystroke under {budget_ms:g} ms" if ok
+              else f"{Colors.FAIL}✗ slowest keystroke over {budget_ms:g} ms")
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def write_sanity_export(path: str, filler_bytes: int, projects: int = 40) -> int:
+    """Write a synthetic `sanity dataset export`: portfolio documents among blog posts and image assets.
+
+    The portfolio documents are the same whatever the size; blog posts (some quoting
+    "project") and asset documents make up the rest. Returns the file size.
+    """
+    featured = scaled_content(projects)['projects']['projects']
+    core_skills = scaled_content(0)['resume']['core_skills']
+    paragraph = "Notes on shipping a project with Next.js, Sanity and a lot of coffee. " * 20
+    with open(path, 'w', encoding='utf-8') as export_file:
+        def write(document):
+            export_file.write(json.dumps(document, separators=(',', ':'), ensure_ascii=False) + '\n')
+        
+        for number, project in enumerate(featured):
+            asset = f"image-{hashlib.sha1(str(number).encode()).hexdigest()}-1280x4000-png"
+            write({'_id': f"project.{number}", '_type': 'project', 'title': project['name'], 'order': number,
+                   'slug': {'_type': 'slug', 'current': f"project-{number}"}, 'description': project['description'],
+                   'tech': project['tech_stack'], 'features': project['highlights'], 'status': 'Live',
+                   'image': {'_type': 'image', 'asset': {'_type': 'reference', '_ref': asset}}})
+            write({'_id': f"drafts.project.{number}", '_type': 'project', 'title': f"{project['name']} (draft)"})
+        for category, skills in core_skills.items():
+            for skill in skills:
+                write({'_id': f"tech.{skill}", '_type': 'techItem', 'name': skill, 'category': category})
+        write({'_id': 'experience.1', '_type': 'experience', 'role': 'Developer', 'company': 'Acme',
+               'period': '2022 — Current', 'achievements': ['Shipped the site']})
+        write({'_id': 'certification.1', '_type': 'certification', 'title': 'Cloud', 'provider': 'IBM',
+               'skills': ['Cloud']})
+        number = 0
+        while export_file.tell() < filler_bytes:
+            number += 1
+            write({'_id': f"post.{number}", '_type': 'blogPost', 'title': f"Post {number}", 'category': 'project',
+                   'body': [{'_type': 'block', '_key': f"k{block}", 'children': [{'_type': 'span', 'text': paragraph}]}
+                            for block in range(8)]})
+            digest = hashlib.sha1(f"asset{number}".encode()).hexdigest()
+            write({'_id': f"image-{digest}-1200x800-jpg", '_type': 'sanity.imageAsset',
+                   'url': f"https://cdn.sanity.io/images/demo/production/{digest}-1200x800.jpg",
+                   'metadata': {'lqip': 'data:image/jpeg;base64,' + 'A' * 600, 'dimensions': {'width': 1200}}})
+    return os.path.getsize(path)
+
+
+def bench_sanity_ingest(sizes=(8 << 20, 80 << 20)):
+    """Parse exports of growing size with the same portfolio content: time, peak memory, cached reopen.
+
+    Peak memory of loading each line with json.loads and keeping the documents is shown for comparison.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = os.path.join(directory, f"export-{size}.ndjson")
+            written = write_sanity_export(path, size)
+            cache = os.path.join(directory, f"cache-{size}")
+            
+            def parse():
+                store = portfolio.SanityExportStore(path, cache_dir=cache)
+                return store._parse(None)
+            
+            started = time.perf_counter()
+            sections = parse()
+            parse_ms = (time.perf_counter() - started) * 1000
+            tracemalloc.start()
+            try:
+                parse()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            tracemalloc.start()
+            try:
+                with open(path, 'rb') as export_file:
+                    everything = [json.loads(line) for line in export_file]
+                naive_peak = tracemalloc.get_traced_memory()[1]
+                del everything
+            finally:
+                tracemalloc.stop()
+            store = portfolio.SanityExportStore(path, cache_dir=cache)
+            store.section('projects')  # Cold: hash, parse and write the cache
+            started = time.perf_counter()
+            cached = portfolio.SanityExportStore(path, cache_dir=cache)
+            cached_projects = cached.section('projects')
+            cached_ms = (time.perf_counter() - started) * 1000
+            results.append((written, parse_ms, peak, naive_peak, cached_ms, not cached.compiled,
+                            len(sections['projects']['projects']), cached_projects == store.section('projects')))
+    return results
+
+
+def check_sanity_ingest(tolerance: float = 0.25) -> bool:
+    """Check that parsing a Sanity export takes the same memory whatever its size, and is cached."""
+    results = bench_sanity_ingest()
+    print(f"{Colors.HEADER}Sanity export ingest — same portfolio content, growing export{Colors.ENDC}")
+    for written, parse_ms, peak, naive_peak, cached_ms, from_cache, projects, same in results:
+        print(f"  {written / (1 << 20):6.1f} MiB: parse {parse_ms:7.1f} ms ({written / (1 << 20) / parse_ms * 1000:5.0f} MiB/s), "
+              f"peak {peak / 1024:7.1f} KiB (json.loads every line: {naive_peak / (1 << 20):6.1f} MiB), "
+              f"cached reopen {cached_ms:6.2f} ms, {projects} projects")
+    small, large = results[0], results[-1]
+    ok = (large[2] <= small[2] * (1 + tolerance) + 64 * 1024
+          and all(from_cache and same for *_, from_cache, _, same in results))
+    status = (f"{Colors.OKGREEN}✓ memory independent of export size; reopening reuses the cache" if ok
+              else f"{Colors.FAIL}✗ memory grows with the export, or the cache was not used")
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+def synthetic_projects(count: int) -> dict:
+    """Return a projects section of count projects with unique text and stacks drawn from the real tags."""
+    content = scaled_content(0)
+    featured = scaled_content(6)['projects']['projects']
+    tags = sorted({tag for project in featured for tag in project['tech_stack']}
+                  | {skill for skills in content['resume']['core_skills'].values() for skill in skills})
+    return {'projects': [
+        {'name': f"Project {number}", 'description': f"{featured[number % len(featured)]['description']} ({number})",
+         'tech_stack': [tags[(number * step) % len(tags)] for step in (1, 3, 7, 11)][:2 + number % 3],
+         'highlights': [f"{highlight} ({number})" for highlight in featured[number % len(featured)]['highlights']],
+         'status': featured[number % len(featured)]['status']}
+        for number in range(count)]}
+
+
+def bench_content_model(count: int = 100_000):
+    """Measure the memory and load time of each project as a loaded dict and in the content model.
+
+    Both come from a content store whose cache already holds the synthetic section:
+    the dict as section() loads it, the model as model() loads and builds it. Overhead
+    is what is held beyond the project's own text (name, description and highlights).
+    """
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'content.json')
+    content = scaled_content(0)
+    content['projects'] = synthetic_projects(count)
+    with open(path, 'w', encoding='utf-8') as content_file:
+        json.dump(content, content_file)
+    del content
+    portfolio.ContentStore(path, directory).section('projects')  # Compile the cache once
+    
+    def retained(build):
+        started = time.perf_counter()
+        build()  # Timed untraced; tracemalloc slows allocation down several times
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        tracemalloc.start()
+        try:
+            kept = build()
+            gc.collect()
+            return kept, tracemalloc.get_traced_memory()[0], elapsed
+        finally:
+            tracemalloc.stop()
+    
+    try:
+        section, dict_bytes, load_s = retained(lambda: portfolio.ContentStore(path, directory).section('projects'))
+        text = sum(sys.getsizeof(project['name']) + sys.getsizeof(project['description'])
+                   + sum(map(sys.getsizeof, project['highlights'])) for project in section['projects'])
+        del section
+        model, model_bytes, build_s = retained(lambda: portfolio.ContentStore(path, directory).model(
+            'projects', portfolio.projects_model, release=True))
+        del model
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    
+    # The real content must survive the model unchanged, and be built once per store
+    saved = portfolio.CONTENT
+    try:
+        portfolio.CONTENT = portfolio.ContentStore(cache_dir=tempfile.mkdtemp())
+        source = copy.deepcopy(portfolio.CONTENT.section('projects')['projects'])
+        projects = portfolio.get_featured_projects()
+        same = ([project.as_dict() for project in projects] == source
+                and portfolio.get_featured_projects() is projects
+                and 'projects' not in portfolio.CONTENT.sections)
+    finally:
+        shutil.rmtree(portfolio.CONTENT.cache_dir, ignore_errors=True)
+        portfolio.CONTENT = saved
+    return {'count': count, 'text': text, 'dict': dict_bytes, 'model': model_bytes,
+            'load_ms': load_s * 1000, 'build_ms': build_s * 1000, 'same': same}
+
+
+def check_content_model(min_saving: float = 0.5, max_slowdown: float = 2.0) -> bool:
+    """Check that the content model at least halves the per-project overhead of the dict layout.
+
+    Loading and building the model must also take at most max_slowdown times loading the dicts.
+    """
+    result = bench_content_model()
+    count, text = result['count'], result['text']
+    dict_overhead = (result['dict'] - text) / count
+    model_overhead = (result['model'] - text) / count
+    print(f"{Colors.HEADER}Content model — {count:,} synthetic projects (text {text / count:.0f} B each){Colors.ENDC}")
+    print(f"  dicts and lists     {result['dict'] / (1 << 20):7.1f} MiB, {dict_overhead:6.0f} B overhead per project "
+          f"(load {result['load_ms']:.0f} ms)")
+    print(f"  slotted, interned   {result['model'] / (1 << 20):7.1f} MiB, {model_overhead:6.0f} B overhead per project "
+          f"(load and build {result['build_ms']:.0f} ms)")
+    ok = model_overhead <= dict_overhead * (1 - min_saving) and result['same']
+    status = (f"{Colors.OKGREEN}✓ {1 - model_overhead / dict_overhead:.0%} less overhead per project" if ok
+              else f"{Colors.FAIL}✗ overhead not halved, or the model changed the content")
+    print(f"  {status}{Colors.ENDC}")
+    slowdown = result['build_ms'] / result['load_ms']
+    fast = slowdown <= max_slowdown
+    status = (f"{Colors.OKGREEN}✓ built in {slowdown:.2f}x the dict load" if fast
+              else f"{Colors.FAIL}✗ built in {slowdown:.2f}x the dict load, over {max_slowdown:g}x")
+    print(f"  {status}{Colors.ENDC}")
+    return ok and fast
+
+
+def bench_serve_sessions(sessions: int = 200):
+    """Open idle telnet sessions on an in-process server; return (KiB resident and threads per session, refused).
+
+    The server is capped at the number opened, so one more connection must be turned away.
+    """
+    import asyncio
+    import socket
+    server = portfolio.PortfolioServer('127.0.0.1', 0, max_sessions=sessions)
+    server.log = lambda message: None
+    loop = asyncio.new_event_loop()
+    listening = threading.Event()
+    address = []
+    
+    async def serve():
+        listener = await asyncio.start_server(server._handle, '127.0.0.1', 0)
+        address.append(listener.sockets[0].getsockname()[:2])
+        listening.set()
+        async with listener:
+            with contextlib.suppress(asyncio.CancelledError):  # Cancelled once the clients are gone
+                await listener.serve_forever()
+    
+    runner = threading.Thread(target=loop.run_until_complete, args=(serve(),), daemon=True)
+    runner.start()
+    listening.wait()
+    rss, threads = portfolio.resident_memory(), threading.active_count()
+    clients = [socket.create_connection(address[0]) for _ in range(sessions)]
+    try:
+        for client in clients:
+            client.settimeout(5)
+            client.recv(65536)  # The welcome frame: the session is up and waiting
+        time.sleep(1)
+        per_session = (portfolio.resident_memory() - rss) / 1024 / sessions
+        thread_count = (threading.active_count() - threads) / sessions
+        with socket.create_connection(address[0], timeout=5) as extra:
+            refused = b'busy' in extra.recv(65536)
+    finally:
+        for client in clients:
+            client.close()
+        deadline = time.monotonic() + 10
+        while server.sessions and time.monotonic() < deadline:
+            time.sleep(0.05)
+        for task in asyncio.all_tasks(loop):
+            loop.call_soon_threadsafe(task.cancel)
+        runner.join(5)
+    return per_session, thread_count, refused
+
+
+def check_serve_sessions(budget_kib: float = 64) -> bool:
+    """Check the memory and threads an idle --serve session costs, and that the session cap holds."""
+    sessions = 200
+    per_session, threads, refused = bench_serve_sessions(sessions)
+    print(f"{Colors.HEADER}Serve mode — {sessions} idle sessions{Colors.ENDC}")
+    print(f"  {per_session:6.1f} KiB resident and {threads:.2f} threads per session "
+          f"({portfolio.SESSION_STACK_SIZE // 1024} KiB stack reserved each)")
+    print(f"  connection {sessions + 1} with a cap of {sessions}: {'turned away' if refused else 'accepted'}")
+    ok = per_session <= budget_kib and refused
+    status = (f"{Colors.OKGREEN}✓ under {budget_kib:g} KiB per session, cap enforced" if ok
+              else f"{Colors.FAIL}✗ sessions cost more than {budget_kib:g} KiB each, or the cap was not enforced")
+    print(f"  {status}{Colors.ENDC}")
+    return ok
+
+
+BENCHMARKS = {
+    'menu-diff': check_menu_diff,
+    'frame-writes': check_frame_writes,
+    'replay': check_replay,
+    'content-startup': check_content_startup,
+    'startup': check_startup,
+    'dashboard-overhead': check_dashboard_overhead,
+    'git-status': check_git_status,
+    'display-width': check_display_width,
+    'reflow': check_reflow,
+    'sgr-savings': check_sgr_savings,
+    'suite': check_suite,
+    'metrics': check_metrics,
+    'asciicast': check_asciicast,
+    'self-update': check_self_update,
+    'pager': check_pager,
+    'navigation': check_navigation,
+    'search': check_search,
+    'sanity-ingest': check_sanity_ingest,
+    'content-model': check_content_model,
+    'serve-sessions': check_serve_sessions,
+}
+
+
+def main(argv=None):
+    """Run the named benchmarks (all by default) and exit non-zero on failure."""
+    parser = argparse.ArgumentParser(description="Run the portfolio benchmarks (all by default).")
+    parser.add_argument('names', nargs='*', metavar='NAME', help=f"one of: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="record the suite's results as the new baseline instead of checking them")
+    parser.add_argument('--threshold', type=float, metavar='FRACTION',
+                        help="allowed growth for every suite metric (e.g. 0.1), overriding the baseline file")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+    SuiteOptions.save_baseline = args.save_baseline
+    SuiteOptions.threshold = args.threshold
+    names = args.names or list(BENCHMARKS)
+    failed = [name for name in names if not BENCHMARKS[name]()]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
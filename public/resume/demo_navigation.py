@@ -9,6 +9,11 @@ import sys
 import termios
 import tty
 
+from portfolio import (
+    EXIT, MENU, OPEN_SECTION, SECTION, SHOW_HELP, SHOW_MENU,
+    ScreenRenderer, navigation_step,
+)
+
 # Color codes for demo
 class Colors:
     HEADER = '\033[95m'
@@ -21,8 +26,12 @@ class Colors:
     CYAN = '\033[96m'
     WHITE = '\033[37m'
 
+# Renderer that repaints only the menu lines that change between frames
+renderer = ScreenRenderer()
+
 def clear_screen():
     """Clear the terminal screen."""
+    renderer.invalidate()
     os.system('cls' if os.name == 'nt' else 'clear')
 
 def get_single_keypress():
@@ -63,25 +72,28 @@ def get_single_keypress():
 
 def display_demo_menu(menu_items, selected_index=0):
     """Display a demo navigation menu."""
-    clear_screen()
-    
-    print(f"{Colors.BOLD}{Colors.HEADER}{'═' * 60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}║        ARROW KEY NAVIGATION DEMO         ║{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'═' * 60}{Colors.ENDC}")
-    print()
-    
-    print(f"{Colors.BOLD}Use ↑/↓ arrow keys to navigate, Enter to select, 'q' to quit:{Colors.ENDC}\n")
+    lines = [
+        f"{Colors.BOLD}{Colors.HEADER}{'═' * 60}{Colors.ENDC}",
+        f"{Colors.BOLD}{Colors.HEADER}║        ARROW KEY NAVIGATION DEMO         ║{Colors.ENDC}",
+        f"{Colors.BOLD}{Colors.HEADER}{'═' * 60}{Colors.ENDC}",
+        "",
+        f"{Colors.BOLD}Use ↑/↓ arrow keys to navigate, Enter to select, 'q' to quit:{Colors.ENDC}",
+        "",
+    ]
     
     for i, (icon, name, description) in enumerate(menu_items):
         if i == selected_index:
             # Highlight selected item
-            print(f"  {Colors.BOLD}{Colors.HEADER}► {icon} {name}{Colors.ENDC}")
-            print(f"    {Colors.CYAN}{description}{Colors.ENDC}")
+            lines.append(f"  {Colors.BOLD}{Colors.HEADER}► {icon} {name}{Colors.ENDC}")
+            lines.append(f"    {Colors.CYAN}{description}{Colors.ENDC}")
         else:
             # Regular item
-            print(f"  {Colors.OKGREEN}  {icon} {name}{Colors.ENDC}")
-            print(f"    {Colors.WHITE}{description}{Colors.ENDC}")
-        print()  # Add spacing between items
+            lines.append(f"  {Colors.OKGREEN}  {icon} {name}{Colors.ENDC}")
+            lines.append(f"    {Colors.WHITE}{description}{Colors.ENDC}")
+        lines.append("")  # Add spacing between items
+    
+    # Only the previously and newly highlighted items are rewritten
+    renderer.render(lines)
 
 def run_demo():
     """Run the navigation demo."""
@@ -94,42 +106,36 @@ def run_demo():
         ("❌", "Exit", "Quit Demo - Thanks for trying!")
     ]
     
-    selected = 0
-    
     print(f"{Colors.OKGREEN}Welcome to the Arrow Key Navigation Demo!{Colors.ENDC}")
     print(f"This demonstrates the navigation system used in the portfolio.")
     print(f"Press any key to start the demo...")
     get_single_keypress()
     
-    while True:
-        display_demo_menu(menu_items, selected)
-        
+    # Same navigation state machine as the portfolio, with demo-sized effects
+    state = (MENU, 0)
+    display_demo_menu(menu_items, 0)
+    while state[0] != EXIT:
         try:
             key = get_single_keypress()
-            
-            if key == 'UP':
-                selected = (selected - 1) % len(menu_items)
-            elif key == 'DOWN':
-                selected = (selected + 1) % len(menu_items)
-            elif key == 'ENTER':
-                clear_screen()
-                item_name = menu_items[selected][1]
-                if item_name == "Exit":
-                    print(f"{Colors.HEADER}Thanks for trying the demo!{Colors.ENDC}")
-                    print(f"{Colors.OKGREEN}Run './portfolio.py' to see the full portfolio! 👋{Colors.ENDC}")
-                    break
-                else:
-                    print(f"{Colors.BOLD}You selected: {Colors.HEADER}{item_name}{Colors.ENDC}")
-                    print(f"{Colors.CYAN}{menu_items[selected][2]}{Colors.ENDC}\n")
-                    print(f"In the real portfolio, this would show the {item_name.lower()} section.")
-                    print(f"\n{Colors.WARNING}Press any key to return to the demo menu...{Colors.ENDC}")
-                    get_single_keypress()
-            elif key.lower() == 'q':
-                break
-                
+            if state[0] == SECTION:
+                key = 'ENTER'  # Any key returns to the demo menu
+            state, effects = navigation_step(state, key, len(menu_items))
         except KeyboardInterrupt:
             break
-    
+        
+        for effect in effects:
+            if effect[0] == SHOW_MENU:
+                display_demo_menu(menu_items, effect[1])
+            elif effect[0] == OPEN_SECTION:
+                clear_screen()
+                item_name = menu_items[effect[1]][1]
+                print(f"{Colors.BOLD}You selected: {Colors.HEADER}{item_name}{Colors.ENDC}")
+                print(f"{Colors.CYAN}{menu_items[effect[1]][2]}{Colors.ENDC}\n")
+                print(f"In the real portfolio, this would show the {item_name.lower()} section.")
+                print(f"\n{Colors.WARNING}Press any key to return to the demo menu...{Colors.ENDC}")
+            elif effect[0] == SHOW_HELP:
+                print(f"\n{Colors.CYAN}↑/↓ to move, Enter or 1-5 to select, 'q' to quit. Press any key...{Colors.ENDC}")
+                renderer.invalidate()
     clear_screen()
     print(f"{Colors.HEADER}Demo completed!{Colors.ENDC}")
     print(f"{Colors.OKGREEN}The full portfolio features the same navigation system with rich content.{Colors.ENDC}")
@@ -3,33 +3,49 @@
 # One-liner: curl -s https://raw.githubusercontent.com/jordolang/portfolio/main/public/resume/launch.sh | bash
 
 echo "🚀 Launching Jordan Lang's Interactive Portfolio..."
-echo "📥 Downloading portfolio script..."
 
-# Create a temporary file to preserve stdin for interactive input
-TEMP_SCRIPT=$(mktemp)
-trap "rm -f $TEMP_SCRIPT" EXIT
+PYTHON=$(command -v python3 || command -v python)
+if [[ -z "$PYTHON" ]]; then
+    echo "❌ Python 3 is required to run the portfolio."
+    exit 1
+fi
+
+# The portfolio keeps a compiled copy of itself here (see portfolio.py --install)
+INSTALL_DIR="${XDG_CACHE_HOME:-$HOME/.cache}/jordolang-portfolio/install"
+LAUNCHER="$INSTALL_DIR/run.py"
 
-# Download the Python portfolio script to temp file
-if curl -s https://jlang.dev/resume/portfolio.py -o "$TEMP_SCRIPT"; then
-    echo "✅ Download complete! Starting portfolio..."
-    echo ""
-    
-    # Check if we're running in a piped environment (like curl | bash)
-    if [[ ! -t 0 ]]; then
-        echo "⚠️ Detected piped execution. Starting in interactive mode..."
-        # Re-open stdin to /dev/tty to restore interactivity
-        if [[ -c /dev/tty ]]; then
-            python3 "$TEMP_SCRIPT" < /dev/tty || python "$TEMP_SCRIPT" < /dev/tty
-        else
-            echo "❌ Cannot access terminal for interactive input."
-            echo "💡 Try running directly: ./launch.sh"
-            exit 1
-        fi
+if [[ -f "$LAUNCHER" ]]; then
+    # Warm launch: a conditional request fetches the script and content only if they changed
+    "$PYTHON" "$LAUNCHER" --update || echo "📦 Starting the cached copy..."
+else
+    echo "📥 Downloading portfolio script..."
+    TEMP_DIR=$(mktemp -d)
+    trap "rm -rf $TEMP_DIR" EXIT
+    # Download the Python portfolio script and its content file side by side, then install them
+    if curl -sf https://jlang.dev/resume/portfolio.py -o "$TEMP_DIR/portfolio.py" &&
+       curl -sf https://jlang.dev/resume/content.json -o "$TEMP_DIR/content.json" &&
+       "$PYTHON" "$TEMP_DIR/portfolio.py" --install; then
+        rm -rf "$TEMP_DIR"  # The installed copy is what runs; exec below skips the trap
+        echo "✅ Download complete! Starting portfolio..."
     else
-        # Normal execution - stdin is already a terminal
-        python3 "$TEMP_SCRIPT" || python "$TEMP_SCRIPT"
+        echo "❌ Failed to download portfolio script. Please check your internet connection."
+        exit 1
+    fi
+fi
+echo ""
+
+# Check if we're running in a piped environment (like curl | bash)
+if [[ ! -t 0 ]]; then
+    echo "⚠️ Detected piped execution. Starting in interactive mode..."
+    # Re-open stdin to /dev/tty to restore interactivity
+    if [[ -c /dev/tty ]]; then
+        exec "$PYTHON" "$LAUNCHER" < /dev/tty
+    else
+        echo "❌ Cannot access terminal for interactive input."
+        echo "💡 Try running directly: ./launch.sh"
+        exit 1
     fi
 else
-    echo "❌ Failed to download portfolio script. Please check your internet connection."
-    exit 1
+    # Normal execution - stdin is already a terminal
+    exec "$PYTHON" "$LAUNCHER"
 fi